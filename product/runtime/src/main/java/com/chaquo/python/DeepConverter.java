@@ -0,0 +1,40 @@
+package com.chaquo.python;
+
+import java.util.*;
+
+/** This class allows convert.py to create or read a whole container in a single call, rather
+ * than calling add, put or next once for each element.
+ *
+ * @deprecated internal use in convert.py. */
+public class DeepConverter {
+
+    public static List<Object> newList(Object[] items) {
+        return new ArrayList<Object>(Arrays.asList(items));
+    }
+
+    public static Set<Object> newSet(Object[] items) {
+        return new LinkedHashSet<Object>(Arrays.asList(items));
+    }
+
+    public static Map<Object,Object> newMap(Object[] keys, Object[] values) {
+        // Same load factor calculation as the HashMap(Map) constructor.
+        Map<Object,Object> map = new LinkedHashMap<>(Math.max((int)(keys.length / .75f) + 1,
+                                                              16));
+        for (int i = 0; i < keys.length; i++) {
+            map.put(keys[i], values[i]);
+        }
+        return map;
+    }
+
+    /** Returns the keys and values of the map in alternating positions. */
+    public static Object[] flattenMap(Map<?,?> map) {
+        Object[] result = new Object[map.size() * 2];
+        int i = 0;
+        for (Map.Entry<?,?> entry : map.entrySet()) {
+            result[i++] = entry.getKey();
+            result[i++] = entry.getValue();
+        }
+        return result;
+    }
+
+}
@@ -110,6 +110,25 @@ public class PyObject extends AbstractMap<String,PyObject> implements AutoClosea
      * <p>Otherwise, a {@code ClassCastException} will be thrown.</p> */
     public native @NotNull <T> T toJava(@NotNull Class<T> klass);
 
+    /** <p>Same as {@link #toJava(Class) toJava(klass)}, except that if {@code deep} is true,
+     * Python containers are first converted to Java containers, including any containers
+     * nested within them. For example, a Python {@code dict} of {@code list}s can be converted
+     * with {@code toJava(Map.class, true)} to a {@code Map} of {@code List}s.</p>
+     *
+     * <p>Elements are converted as if they were passed to a parameter of type {@code Object},
+     * so a Python {@code int} becomes a {@code java.lang.Long}. To create an {@code Integer},
+     * wrap the value in Python using {@code jint(...)}.</p>
+     *
+     * <p>For details of the conversion, see <a
+     * href="../../../../python.html#java.to_java">java.to_java</a>.</p> */
+    public @NotNull <T> T toJava(@NotNull Class<T> klass, boolean deep) {
+        if (! deep) {
+            return toJava(klass);
+        }
+        return requireNonNull(Python.getInstance().getModule("java")
+                              .callAttr("to_java", this)).toJava(klass);
+    }
+
 
     // === Primitive conversions =============================================
 
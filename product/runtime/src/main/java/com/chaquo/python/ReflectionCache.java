@@ -0,0 +1,353 @@
+package com.chaquo.python;
+
+import java.io.*;
+import java.lang.reflect.*;
+import java.util.*;
+
+/** Persistent cache of the member tables built by {@link Reflector}. On later process starts,
+ * this allows members which were seen previously to be looked up individually by name, without
+ * calling getDeclaredMethods, getDeclaredFields or getDeclaredClasses, which are slow on
+ * Android.
+ *
+ * <p>A class may change without the key changing, e.g. when a system module is updated. So
+ * names which are missing from the cache still cause the whole class to be reflected. However,
+ * if a cached method name has gained overloads, they won't be visible until the key
+ * changes.</p>
+ *
+ * <p>The cache is disabled unless {@link #open open} has been called. Its contents are
+ * discarded whenever the key changes, so the key must identify everything which could affect
+ * the reflected classes, e.g. the app version and the OS build.</p>
+ *
+ * <p>The cache also serves as a record of which classes and members the app uses, which
+ * AndroidPlatform can use to look them up in advance.</p>
+ *
+ * @deprecated internal use in Reflector and AndroidPlatform. */
+public class ReflectionCache {
+
+    private static final int FORMAT_VERSION = 2;
+
+    // Upper limit for any count in the file, so that a corrupt file can't cause a huge
+    // allocation.
+    private static final int MAX_COUNT = 0xffff;
+
+    // Classes tend to be reflected in bursts, so wait until there have been no changes for
+    // this long before saving.
+    private static final long SAVE_DELAY_MS = 5000;
+
+    /** Each table is null if it hasn't been loaded yet. Tables may be replaced if they're
+     * found to be out of date, but they're never modified. */
+    static class Entry {
+        volatile Map<String,List<String[]>> methods;  // Name -> parameter type names
+        volatile Set<String> fields;
+        volatile Map<String,String> classes;          // Simple name -> binary name
+        volatile Set<String> used;                    // Names successfully looked up, in order
+    }
+
+    private static File file;
+    private static String key;
+    private static Set<ClassLoader> loaders;
+    private static Map<String,Entry> entries;  // In order of first use
+    private static Timer saveTimer;
+    private static TimerTask saveTask;
+    private static final Object saveLock = new Object();
+
+    /** Enables the cache, using the given file. It will not be read until the first class is
+     * reflected. Only classes loaded by the given class loader or its ancestors will be
+     * cached. */
+    public static synchronized void open(File file, String key, ClassLoader loader) {
+        ReflectionCache.file = file;
+        ReflectionCache.key = key;
+        loaders = new HashSet<>();
+        for (ClassLoader l = loader; l != null; l = l.getParent()) {
+            loaders.add(l);
+        }
+        entries = null;
+    }
+
+    /** Returns the cached tables for the given class, or null if there are none. */
+    static synchronized Entry get(Class<?> klass) {
+        if (! isCacheable(klass)) return null;
+        if (entries == null) load();
+        return entries.get(klass.getName());
+    }
+
+    /** Returns the names of all classes in the cache, in the order they were first used. This
+     * includes classes used in previous processes with the same key. */
+    public static synchronized String[] getClassNames() {
+        if (file == null) return new String[0];
+        if (entries == null) load();
+        return entries.keySet().toArray(new String[0]);
+    }
+
+    /** Returns the names of the methods, fields and nested classes of the given class which
+     * have been successfully looked up, not including constructors. This includes names used
+     * in previous processes with the same key. */
+    public static synchronized String[] getUsedNames(String className) {
+        if (file == null) return new String[0];
+        if (entries == null) load();
+        Entry entry = entries.get(className);
+        if (entry == null || entry.used == null) return new String[0];
+
+        Set<String> names = new LinkedHashSet<>(entry.used);
+        names.remove("<init>");
+        return names.toArray(new String[0]);
+    }
+
+    static synchronized void putMethods(Class<?> klass, Map<String,List<String[]>> methods) {
+        Entry entry = getOrCreate(klass);
+        if (entry != null) {
+            entry.methods = methods;
+            scheduleSave();
+        }
+    }
+
+    static synchronized void putFields(Class<?> klass, Set<String> fields) {
+        Entry entry = getOrCreate(klass);
+        if (entry != null) {
+            entry.fields = fields;
+            scheduleSave();
+        }
+    }
+
+    static synchronized void putClasses(Class<?> klass, Map<String,String> classes) {
+        Entry entry = getOrCreate(klass);
+        if (entry != null) {
+            entry.classes = classes;
+            scheduleSave();
+        }
+    }
+
+    static synchronized void putUsed(Class<?> klass, String name) {
+        Entry entry = getOrCreate(klass);
+        if (entry != null && (entry.used == null || ! entry.used.contains(name))) {
+            Set<String> used = new LinkedHashSet<>();
+            if (entry.used != null) used.addAll(entry.used);
+            used.add(name);
+            entry.used = used;
+            scheduleSave();
+        }
+    }
+
+    private static Entry getOrCreate(Class<?> klass) {
+        if (! isCacheable(klass)) return null;
+        if (entries == null) load();
+        Entry entry = entries.get(klass.getName());
+        if (entry == null) {
+            entry = new Entry();
+            entries.put(klass.getName(), entry);
+        }
+        return entry;
+    }
+
+    // Classes are identified by name alone, so we only cache those whose names identify them
+    // consistently between processes. This excludes classes from other class loaders, and
+    // dynamic proxy classes, whose names are assigned at runtime.
+    private static boolean isCacheable(Class<?> klass) {
+        if (file == null || Proxy.isProxyClass(klass)) return false;
+        ClassLoader loader = klass.getClassLoader();
+        return (loader == null) || loaders.contains(loader);
+    }
+
+    /** Resolves a type name in the format returned by Class.getName. */
+    static Class<?> resolveType(Class<?> klass, String name) throws ClassNotFoundException {
+        Class<?> primitive = PRIMITIVES.get(name);
+        if (primitive != null) {
+            return primitive;
+        }
+        return Class.forName(name, false, klass.getClassLoader());
+    }
+
+    private static final Map<String,Class<?>> PRIMITIVES = new HashMap<>();
+    static {
+        for (Class<?> k : new Class<?>[] { boolean.class, byte.class, short.class, int.class,
+                                           long.class, float.class, double.class, char.class }) {
+            PRIMITIVES.put(k.getName(), k);
+        }
+    }
+
+    // === Persistence =======================================================
+
+    private static void load() {
+        entries = new LinkedHashMap<>();
+        if (! file.exists()) return;
+        try {
+            DataInputStream in = new DataInputStream(new BufferedInputStream(
+                new FileInputStream(file)));
+            try {
+                if (in.readInt() != FORMAT_VERSION || ! in.readUTF().equals(key)) {
+                    return;
+                }
+                Map<String,Entry> loaded = new LinkedHashMap<>();
+                for (int i = readCount(in); i > 0; i--) {
+                    String className = in.readUTF();
+                    Entry entry = new Entry();
+                    if (in.readBoolean()) entry.methods = readMethods(in);
+                    if (in.readBoolean()) entry.fields = readNames(in);
+                    if (in.readBoolean()) entry.classes = readClasses(in);
+                    if (in.readBoolean()) entry.used = readNames(in);
+                    loaded.put(className, entry);
+                }
+                entries = loaded;
+            } finally {
+                in.close();
+            }
+        } catch (IOException | RuntimeException e) {
+            // The file is incomplete or corrupt: it'll be replaced by the next save.
+        }
+    }
+
+    private static int readCount(DataInputStream in) throws IOException {
+        int count = in.readInt();
+        if (count < 0 || count > MAX_COUNT) {
+            throw new IOException("Invalid count " + count);
+        }
+        return count;
+    }
+
+    private static Map<String,List<String[]>> readMethods(DataInputStream in)
+        throws IOException {
+        Map<String,List<String[]>> methods = new HashMap<>();
+        for (int i = readCount(in); i > 0; i--) {
+            String name = in.readUTF();
+            List<String[]> overloads = new ArrayList<>();
+            for (int j = readCount(in); j > 0; j--) {
+                String[] params = new String[readCount(in)];
+                for (int k = 0; k < params.length; k++) {
+                    params[k] = in.readUTF();
+                }
+                overloads.add(params);
+            }
+            methods.put(name, overloads);
+        }
+        return methods;
+    }
+
+    private static Set<String> readNames(DataInputStream in) throws IOException {
+        Set<String> names = new LinkedHashSet<>();
+        for (int i = readCount(in); i > 0; i--) {
+            names.add(in.readUTF());
+        }
+        return names;
+    }
+
+    private static Map<String,String> readClasses(DataInputStream in) throws IOException {
+        Map<String,String> classes = new HashMap<>();
+        for (int i = readCount(in); i > 0; i--) {
+            classes.put(in.readUTF(), in.readUTF());
+        }
+        return classes;
+    }
+
+    private static void scheduleSave() {
+        if (saveTimer == null) {
+            saveTimer = new Timer("ReflectionCache", true);
+        }
+        if (saveTask != null) {
+            saveTask.cancel();
+        }
+        saveTask = new TimerTask() {
+            @Override public void run() {
+                save();
+            }
+        };
+        saveTimer.schedule(saveTask, SAVE_DELAY_MS);
+    }
+
+    private static void save() {
+        synchronized (saveLock) {
+            saveLocked();
+        }
+    }
+
+    private static void saveLocked() {
+        File file;
+        String key;
+        Map<String,Entry> snapshot = new LinkedHashMap<>();
+        synchronized (ReflectionCache.class) {
+            if (entries == null) return;  // open() was called again.
+            file = ReflectionCache.file;
+            key = ReflectionCache.key;
+
+            // The tables are immutable, so we only need to copy the references.
+            for (Map.Entry<String,Entry> me : entries.entrySet()) {
+                Entry entry = new Entry();
+                entry.methods = me.getValue().methods;
+                entry.fields = me.getValue().fields;
+                entry.classes = me.getValue().classes;
+                entry.used = me.getValue().used;
+                snapshot.put(me.getKey(), entry);
+            }
+        }
+
+        // Don't hold the lock while writing, because other threads may be waiting to reflect
+        // classes. Other processes of the same app may be saving at the same time, so each one
+        // needs its own temporary file.
+        File tmpFile = null;
+        try {
+            file.getParentFile().mkdirs();
+            tmpFile = File.createTempFile(file.getName(), ".tmp", file.getParentFile());
+            DataOutputStream out = new DataOutputStream(new BufferedOutputStream(
+                new FileOutputStream(tmpFile)));
+            try {
+                out.writeInt(FORMAT_VERSION);
+                out.writeUTF(key);
+                out.writeInt(snapshot.size());
+                for (Map.Entry<String,Entry> me : snapshot.entrySet()) {
+                    out.writeUTF(me.getKey());
+                    Entry entry = me.getValue();
+                    out.writeBoolean(entry.methods != null);
+                    if (entry.methods != null) writeMethods(out, entry.methods);
+                    out.writeBoolean(entry.fields != null);
+                    if (entry.fields != null) writeNames(out, entry.fields);
+                    out.writeBoolean(entry.classes != null);
+                    if (entry.classes != null) writeClasses(out, entry.classes);
+                    out.writeBoolean(entry.used != null);
+                    if (entry.used != null) writeNames(out, entry.used);
+                }
+            } finally {
+                out.close();
+            }
+            if (! tmpFile.renameTo(file)) {
+                throw new IOException("Failed to create " + file);
+            }
+        } catch (IOException e) {
+            // The cache is only an optimization, so carry on without it.
+            if (tmpFile != null) {
+                tmpFile.delete();
+            }
+        }
+    }
+
+    private static void writeMethods(DataOutputStream out, Map<String,List<String[]>> methods)
+        throws IOException {
+        out.writeInt(methods.size());
+        for (Map.Entry<String,List<String[]>> me : methods.entrySet()) {
+            out.writeUTF(me.getKey());
+            out.writeInt(me.getValue().size());
+            for (String[] params : me.getValue()) {
+                out.writeInt(params.length);
+                for (String param : params) {
+                    out.writeUTF(param);
+                }
+            }
+        }
+    }
+
+    private static void writeNames(DataOutputStream out, Set<String> names)
+        throws IOException {
+        out.writeInt(names.size());
+        for (String name : names) {
+            out.writeUTF(name);
+        }
+    }
+
+    private static void writeClasses(DataOutputStream out, Map<String,String> classes)
+        throws IOException {
+        out.writeInt(classes.size());
+        for (Map.Entry<String,String> me : classes.entrySet()) {
+            out.writeUTF(me.getKey());
+            out.writeUTF(me.getValue());
+        }
+    }
+
+}
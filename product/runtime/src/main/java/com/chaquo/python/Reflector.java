@@ -4,7 +4,8 @@ import java.lang.reflect.*;
 import java.util.*;
 
 /** This class is critical for performance, as it allows us to call the reflection API mostly
- * from Java, and only create Python class members on demand.
+ * from Java, and only create Python class members on demand. Where possible, the member tables
+ * are also loaded from {@link ReflectionCache} rather than by reflecting the whole class.
  *
  * @deprecated internal use in class.pxi. */
 public class Reflector {
@@ -14,10 +15,13 @@ public class Reflector {
     private Map<String,List<Member>> multipleMethods; // java.lang.reflect.Executable.
     private Map<String,Field> fields;
     private Map<String,Class<?>> classes;
+    private final ReflectionCache.Entry cached;
 
     private static Map<Class<?>, Reflector> instances = new HashMap<>();
 
-    public static Reflector getInstance(Class<?> klass) {
+    // This may be called by multiple threads at once, because the GIL is released during JNI
+    // calls.
+    public static synchronized Reflector getInstance(Class<?> klass) {
         Reflector reflector = instances.get(klass);
         if (reflector != null) {
             return reflector;
@@ -29,9 +33,12 @@ public class Reflector {
 
     private Reflector(Class<?> klass) {
         this.klass = klass;
+        cached = ReflectionCache.get(klass);
     }
 
     public synchronized String[] dir() {
+        // Don't use the cache here, because it may be missing members which have been added
+        // since it was written.
         if (methods == null) loadMethods();
         if (fields == null) loadFields();
         if (classes == null) loadClasses();
@@ -44,7 +51,25 @@ public class Reflector {
     }
 
     public synchronized Member[] getMethods(String name) {
-        if (methods == null) loadMethods();
+        Member[] result = findMethods(name);
+        if (result != null) ReflectionCache.putUsed(klass, name);
+        return result;
+    }
+
+    private Member[] findMethods(String name) {
+        if (methods == null) {
+            if (cached != null && cached.methods != null) {
+                // A name missing from the cache may still exist, e.g. if a system module has
+                // been updated, so only positive results can be trusted. Overloads added by such
+                // an update will be missed: see ReflectionCache.
+                List<String[]> overloads = cached.methods.get(name);
+                if (overloads != null) {
+                    Member[] result = resolveMethods(name, overloads);
+                    if (result != null) return result;
+                }
+            }
+            loadMethods();
+        }
         List<Member> list = multipleMethods.get(name);
         if (list != null) {
             return list.toArray(new Member[0]);
@@ -69,6 +94,50 @@ public class Reflector {
                 loadMethod(m, m.getName());
             }
         }
+
+        Map<String,List<String[]>> overloads = new HashMap<>();
+        for (Map.Entry<String,Member> me : methods.entrySet()) {
+            overloads.put(me.getKey(),
+                          Collections.singletonList(getParameterTypeNames(me.getValue())));
+        }
+        for (Map.Entry<String,List<Member>> me : multipleMethods.entrySet()) {
+            List<String[]> list = new ArrayList<>();
+            for (Member m : me.getValue()) {
+                list.add(getParameterTypeNames(m));
+            }
+            overloads.put(me.getKey(), list);
+        }
+        ReflectionCache.putMethods(klass, overloads);
+    }
+
+    private static String[] getParameterTypeNames(Member m) {
+        Class<?>[] types = (m instanceof Method) ? ((Method)m).getParameterTypes()
+                                                 : ((Constructor<?>)m).getParameterTypes();
+        String[] names = new String[types.length];
+        for (int i = 0; i < types.length; i++) {
+            names[i] = types[i].getName();
+        }
+        return names;
+    }
+
+    /** Returns null if any of the cached overloads no longer match the class. */
+    private Member[] resolveMethods(String name, List<String[]> overloads) {
+        Member[] result = new Member[overloads.size()];
+        try {
+            for (int i = 0; i < result.length; i++) {
+                String[] typeNames = overloads.get(i);
+                Class<?>[] types = new Class<?>[typeNames.length];
+                for (int j = 0; j < types.length; j++) {
+                    types[j] = ReflectionCache.resolveType(klass, typeNames[j]);
+                }
+                result[i] = name.equals("<init>") ? klass.getDeclaredConstructor(types)
+                                                  : klass.getDeclaredMethod(name, types);
+                if (! isAccessible(result[i])) return null;
+            }
+        } catch (ClassNotFoundException | NoSuchMethodException | LinkageError e) {
+            return null;
+        }
+        return result;
     }
 
     private Collection<Method> getDeclaredMethods() {
@@ -125,7 +194,21 @@ public class Reflector {
     }
 
     public synchronized Field getField(String name) {
-        if (fields == null) loadFields();
+        Field result = findField(name);
+        if (result != null) ReflectionCache.putUsed(klass, name);
+        return result;
+    }
+
+    private Field findField(String name) {
+        if (fields == null) {
+            if (cached != null && cached.fields != null && cached.fields.contains(name)) {
+                try {
+                    Field f = klass.getDeclaredField(name);
+                    if (isAccessible(f)) return f;
+                } catch (NoSuchFieldException | LinkageError ignored) {}
+            }
+            loadFields();
+        }
         return fields.get(name);
     }
 
@@ -136,6 +219,7 @@ public class Reflector {
                 fields.put(f.getName(), f);
             }
         }
+        ReflectionCache.putFields(klass, new HashSet<>(fields.keySet()));
     }
 
     private Collection<Field> getDeclaredFields() {
@@ -163,7 +247,22 @@ public class Reflector {
     }
 
     public synchronized Class<?> getNestedClass(String name) {
-        if (classes == null) loadClasses();
+        Class<?> result = findNestedClass(name);
+        if (result != null) ReflectionCache.putUsed(klass, name);
+        return result;
+    }
+
+    private Class<?> findNestedClass(String name) {
+        if (classes == null) {
+            String binaryName = (cached != null && cached.classes != null)
+                                ? cached.classes.get(name) : null;
+            if (binaryName != null) {
+                try {
+                    return ReflectionCache.resolveType(klass, binaryName);
+                } catch (ClassNotFoundException | LinkageError ignored) {}
+            }
+            loadClasses();
+        }
         return classes.get(name);
     }
 
@@ -176,6 +275,12 @@ public class Reflector {
                 classes.put(simpleName, k);
             }
         }
+
+        Map<String,String> binaryNames = new HashMap<>();
+        for (Map.Entry<String,Class<?>> me : classes.entrySet()) {
+            binaryNames.put(me.getKey(), me.getValue().getName());
+        }
+        ReflectionCache.putClasses(klass, binaryNames);
     }
 
     private boolean isAccessible(Member m) {
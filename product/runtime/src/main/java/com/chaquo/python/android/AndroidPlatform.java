@@ -2,6 +2,7 @@ package com.chaquo.python.android;
 
 import android.app.*;
 import android.content.*;
+import android.content.pm.*;
 import android.content.res.*;
 import android.os.*;
 import com.chaquo.python.*;
@@ -50,6 +51,7 @@ public class AndroidPlatform extends Python.Platform {
     private SharedPreferences sp;
     private JSONObject buildJson;
     private AssetManager am;
+    private boolean prewarmClasses;
 
     /** Uses the {@link android.app.Application} context of the given context to initialize
      * Python. */
@@ -76,6 +78,21 @@ public class AndroidPlatform extends Python.Platform {
             throw new RuntimeException("None of this device's ABIs " + supportedAbis +
                                        " are supported by this app.");
         }
+
+        ReflectionCache.open(new File(mContext.getCacheDir(), Common.ASSET_DIR + "/reflector"),
+                             getReflectionCacheKey(), mContext.getClassLoader());
+    }
+
+    /** Reflection results depend on both the app and the system classes, so the cache must
+     * be invalidated whenever either of them is updated. */
+    private String getReflectionCacheKey() {
+        try {
+            PackageInfo pi = mContext.getPackageManager().getPackageInfo(
+                mContext.getPackageName(), 0);
+            return pi.lastUpdateTime + "/" + Build.FINGERPRINT;
+        } catch (PackageManager.NameNotFoundException e) {
+            throw new RuntimeException(e);
+        }
     }
 
     /** Returns the Application context of the context which was passed to the contructor. */
@@ -83,6 +100,19 @@ public class AndroidPlatform extends Python.Platform {
         return mContext;
     }
 
+    /** <p>Sets whether to load Java classes in advance. If enabled, then once Python has
+     * started, a background thread will load all Java classes which were used from Python in
+     * previous runs of the current app version, and look up the methods, fields and nested
+     * classes which Python used from them. This reduces the time taken when those classes and
+     * members are first used.</p>
+     *
+     * <p>The default is {@code false}. This method must be called before passing the
+     * AndroidPlatform to {@link Python#start Python.start()}.</p> */
+    public @NotNull AndroidPlatform setPrewarmClasses(boolean prewarmClasses) {
+        this.prewarmClasses = prewarmClasses;
+        return this;
+    }
+
     @Override
     public @NotNull String getPath() {
         // These assets will be extracted to separate files and used as the initial PYTHONPATH.
@@ -129,7 +159,11 @@ public class AndroidPlatform extends Python.Platform {
             Common.ASSET_REQUIREMENTS,
             Common.ASSET_STDLIB + "-" + ABI,
         };
-        py.getModule("java.android").callAttr("initialize", mContext, buildJson, appPath);
+        PyObject module = py.getModule("java.android");
+        module.callAttr("initialize", mContext, buildJson, appPath);
+        if (prewarmClasses) {
+            module.callAttr("prewarm_classes", (Object) ReflectionCache.getClassNames());
+        }
     }
 
     private void extractAssets(List<String> assets) throws IOException, JSONException {
@@ -30,12 +30,14 @@ __path__ = extend_path(__path__, __name__)
 from .chaquopy import (cast, chaquopy_init, detach, jarray, jclass, set_import_enabled,
                        dynamic_proxy, static_proxy, constructor, method, Override)
 from .primitive import jvoid, jboolean, jbyte, jshort, jint, jlong, jfloat, jdouble, jchar
+from .convert import to_java, to_python
 
 # This is the public API.
 __all__ = [
     "cast", "detach", "jarray", "jclass", "set_import_enabled",
     "dynamic_proxy", "static_proxy", "constructor", "method", "Override",
     "jvoid", "jboolean", "jbyte", "jshort", "jint", "jlong", "jfloat", "jdouble", "jchar",
+    "to_java", "to_python",
 ]
 
 
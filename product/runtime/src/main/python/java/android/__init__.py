@@ -4,6 +4,7 @@ from importlib import reload
 import os
 from os.path import join
 import sys
+from threading import Thread
 import traceback
 from types import ModuleType
 from . import stream, importer
@@ -15,6 +16,29 @@ def initialize(context, build_json, app_path):
     initialize_stdlib(context)
 
 
+def prewarm_classes(names):
+    names = list(names)
+
+    # jclass only loads the class: its members are reflected when they're first looked up, so
+    # also look up the members which were used before. This holds the GIL for much of the
+    # time, but it still keeps the work off the thread which first uses each class.
+    def prewarm():
+        from java import jclass
+        ReflectionCache = jclass("com.chaquo.python.ReflectionCache")
+        for name in names:
+            try:
+                cls = jclass(name)
+            except Exception:
+                continue  # The class may have been removed, or may not be loadable by name.
+            for member in ReflectionCache.getUsedNames(name):
+                try:
+                    getattr(cls, member)
+                except Exception:
+                    pass  # e.g. an instance field, or a member which has been removed.
+
+    Thread(target=prewarm, name="chaquopy-prewarm", daemon=True).start()
+
+
 def initialize_stdlib(context):
     # These are ordered roughly from low to high level.
     for name in ["sys", "os", "tempfile", "ssl", "hashlib", "multiprocessing"]:
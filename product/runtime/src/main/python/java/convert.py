@@ -0,0 +1,95 @@
+"""Copyright (c) 2020 Chaquo Ltd. All rights reserved."""
+
+from collections.abc import Mapping
+
+from . import chaquopy
+from .chaquopy import JavaArray, jarray, jclass
+from .primitive import jbyte
+
+__all__ = ["to_java", "to_python"]
+
+
+def to_java(obj, deep=True):
+    """Converts a Python container to a new Java container:
+
+    * A mapping becomes a `java.util.LinkedHashMap`.
+    * A `set` or `frozenset` becomes a `java.util.LinkedHashSet`.
+    * A `list` or `tuple` becomes a `java.util.ArrayList`.
+    * `bytes` or `bytearray` becomes a `byte[]` array.
+
+    Each container is created with one Java method call, however many elements it has. If
+    `deep` is true, containers nested within `obj` are converted in the same way; otherwise
+    they are passed to Java unchanged. Any other object is returned unchanged, and will be
+    converted in the usual way when it's passed to Java.
+
+    Elements are stored as if they were passed to a parameter of type `Object`, so a Python
+    `int` becomes a `java.lang.Long`. If the Java code expects another type, wrap the values
+    in the corresponding primitive class, e.g. `to_java({"k": [jint(1), jint(2)]})` gives a
+    `Map<String, List<Integer>>`.
+    """
+    # chaquopy.JavaObject doesn't exist until the VM is started, which is after this module is
+    # imported, so it must be looked up at the point of use.
+    if isinstance(obj, (chaquopy.JavaObject, JavaArray)):
+        return obj
+    elif isinstance(obj, (bytes, bytearray)):
+        return jarray(jbyte)(obj)
+    elif isinstance(obj, Mapping):
+        keys, values = [], []
+        for k, v in obj.items():
+            keys.append(k)
+            values.append(v)
+        return jclass("com.chaquo.python.DeepConverter").newMap(
+            object_array(keys, deep), object_array(values, deep))
+    elif isinstance(obj, (set, frozenset)):
+        return jclass("com.chaquo.python.DeepConverter").newSet(object_array(obj, deep))
+    elif isinstance(obj, (list, tuple)):
+        return jclass("com.chaquo.python.DeepConverter").newList(object_array(obj, deep))
+    else:
+        return obj
+
+
+def object_array(items, deep):
+    if deep:
+        items = [to_java(item) for item in items]
+    return jarray("Ljava/lang/Object;")(items)
+
+
+def to_python(obj, deep=True):
+    """Converts a Java container to a new Python container:
+
+    * A `java.util.Map` becomes a `dict`.
+    * A `java.util.Set` becomes a `set`.
+    * Any other `java.util.Collection`, or an array, becomes a `list`.
+    * A `byte[]` array becomes `bytes`.
+
+    The contents of each collection or map are retrieved with one Java method call, but the
+    elements are still converted to Python one at a time, as they are for an array. If `deep`
+    is true, containers nested within `obj` are converted in the same way, except for map keys
+    and set elements, because most Python containers are not hashable. Any other object is
+    returned unchanged.
+    """
+    if isinstance(obj, JavaArray):
+        if isinstance(obj, jarray(jbyte)):
+            return bytes(obj)
+        return python_list(obj, deep)
+    elif not isinstance(obj, chaquopy.JavaObject):
+        return obj
+    elif isinstance(obj, jclass("java.util.Map")):
+        flat = list(jclass("com.chaquo.python.DeepConverter").flattenMap(obj))
+        values = flat[1::2]
+        if deep:
+            values = [to_python(v) for v in values]
+        return dict(zip(flat[0::2], values))
+    elif isinstance(obj, jclass("java.util.Set")):
+        return set(obj.toArray())
+    elif isinstance(obj, jclass("java.util.Collection")):
+        return python_list(obj.toArray(), deep)
+    else:
+        return obj
+
+
+def python_list(array, deep):
+    if deep:
+        return [to_python(item) for item in array]
+    else:
+        return list(array)